@@ -1,17 +1,66 @@
 from flask import Flask
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
+
+# Fastest JSON codec available on this interpreter: orjson on CPython,
+# ujson on PyPy (orjson ships no PyPy wheels), stdlib json otherwise
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        from ujson import dumps as _json_dumps, loads as _json_loads
+    except ImportError:
+        from json import dumps as _json_dumps, loads as _json_loads
 
 # 🤖 AI-Generated Content Notice:
 # This Flask application and all its components are generated by AI.
 # Report inconsistencies at: https://github.com/safinayah/startup-analytics-tutorial
 
+# Response cache shared by the API routes.
+# The metrics come from a static JSON file, so serving cached responses
+# for a short TTL avoids recomputing (and re-serializing) on every poll.
+cache = Cache(config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': 60
+})
+
+class FastJSONProvider(JSONProvider):
+    """
+    JSON provider backed by the fastest codec available, so jsonify
+    serializes API responses in native code instead of the stdlib encoder
+    """
+
+    def dumps(self, obj, **kwargs):
+        return _json_dumps(obj)
+
+    def loads(self, s, **kwargs):
+        return _json_loads(s)
+
 def create_app():
     """Simple application factory for tutorial dashboard only"""
-    app = Flask(__name__, 
+    app = Flask(__name__,
                 template_folder='../templates',
                 static_folder='../static')
-    
+
+    # Serialize JSON responses with the fast provider
+    app.json = FastJSONProvider(app)
+
+    # Enable response caching for the API routes
+    cache.init_app(app)
+
+    # Compress JSON responses on the wire (repeated keys and round
+    # numbers compress 5-10x); prefer Brotli when the client supports it
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    Compress(app)
+
     # Register main blueprint
     from app.routes import main_bp
     app.register_blueprint(main_bp)
-    
+
     return app
\ No newline at end of file
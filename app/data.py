@@ -0,0 +1,43 @@
+"""
+Shared Business Metrics Data
+Loads data/business_metrics.json once per process and shares the parsed dict
+
+🤖 AI-Generated Content Notice:
+This data-loading module is generated by AI.
+Report inconsistencies at: https://github.com/safinayah/startup-analytics-tutorial
+"""
+
+import mmap
+import os
+import types
+
+try:
+    import orjson as _json
+except ImportError:
+    # orjson has no PyPy wheels; stdlib json parses bytes just as happily
+    import json as _json
+
+# Resolve the data file relative to the repo root so the preload works
+# regardless of the current working directory
+DATA_FILE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'business_metrics.json'
+)
+
+def _load_business_metrics():
+    """
+    Memory-map the JSON file and parse it with orjson. The mapped pages
+    are shared by the OS, so preforked Gunicorn workers don't each pay
+    for their own copy of the raw file.
+    """
+    with open(DATA_FILE_PATH, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _json.loads(mapped[:])
+
+try:
+    # Read-only view so no caller can mutate the shared data by accident;
+    # consumers that need a mutable copy take dict(BUSINESS_METRICS)
+    BUSINESS_METRICS = types.MappingProxyType(_load_business_metrics())
+except (FileNotFoundError, ValueError):
+    # Missing/broken file - consumers fall back to their own defaults
+    BUSINESS_METRICS = None
@@ -3,10 +3,148 @@ Google Analytics 4 Integration Service
 Pulls real data from GA4 to populate the startup metrics dashboard
 """
 
+import copy
 import os
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-import json
+import time
+from functools import lru_cache
+from typing import Dict, Optional
+from datetime import datetime
+
+# Resolve GA4 configuration once at import instead of per instantiation
+_DEFAULT_PROPERTY_ID = os.getenv('GA4_PROPERTY_ID')
+_DEFAULT_CREDENTIALS_PATH = os.getenv('GA4_CREDENTIALS_PATH')
+
+# The last_updated timestamp only needs 1-second resolution, so cache
+# the formatted string and refresh it at most once per second instead
+# of paying for datetime.now().isoformat() on every call
+_ts_cache = [0.0, ""]
+
+def _iso_now() -> str:
+    """
+    Return the current time as an ISO string, cached at 1s resolution
+    """
+    now = time.time()
+    if now - _ts_cache[0] > 1.0:
+        _ts_cache[0] = now
+        _ts_cache[1] = datetime.fromtimestamp(now).isoformat()
+    return _ts_cache[1]
+
+# Mock payloads hoisted to module level so the same literals aren't
+# rebuilt on every call. The getters hand out deep copies - callers
+# could previously mutate their (fresh) result safely, and a
+# MappingProxyType wrapper would break both orjson serialization and
+# copy.deepcopy further down
+_WEBSITE_VISITORS_BASE = {
+    'total_visitors': 12450,
+    'new_visitors': 8930,
+    'returning_visitors': 3520
+}
+
+_CONVERSION_FUNNEL = {
+    'website_visitors': 12450,
+    'sign_ups': 1245,
+    'trial_users': 374,
+    'paid_customers': 187,
+    'retained_customers': 156,
+    'conversion_rates': {
+        'visitor_to_signup': 10.0,
+        'signup_to_trial': 30.0,
+        'trial_to_paid': 50.0,
+        'retention_rate': 94.8
+    }
+}
+
+_REVENUE = {
+    'total_revenue': 62000,
+    'monthly_revenue': 62000,
+    'average_order_value': 20.83,
+    'transactions': 187,
+    'revenue_per_visitor': 4.98
+}
+
+_TRAFFIC_SOURCES = {
+    'organic_search': {
+        'visitors': 5603,
+        'percentage': 45.0,
+        'conversion_rate': 1.5
+    },
+    'social_media': {
+        'visitors': 3113,
+        'percentage': 25.0,
+        'conversion_rate': 0.8
+    },
+    'paid_ads': {
+        'visitors': 1868,
+        'percentage': 15.0,
+        'conversion_rate': 1.2
+    },
+    'referrals': {
+        'visitors': 1245,
+        'percentage': 10.0,
+        'conversion_rate': 2.0
+    },
+    'direct_traffic': {
+        'visitors': 622,
+        'percentage': 5.0,
+        'conversion_rate': 2.5
+    }
+}
+
+_USER_BEHAVIOR = {
+    'sessions_per_user': 4.2,
+    'average_session_duration': 12.5,
+    'return_user_rate': 67.0,
+    'bounce_rate': 35.2,
+    'pages_per_session': 3.8
+}
+
+_COHORT_RETENTION = {
+    'cohorts': [
+        {
+            'month': 'Jan 2024',
+            'm0': 100,
+            'm1': 89,
+            'm2': 76
+        },
+        {
+            'month': 'Feb 2024',
+            'm0': 100,
+            'm1': 92,
+            'm2': 81
+        },
+        {
+            'month': 'Mar 2024',
+            'm0': 100,
+            'm1': 85,
+            'm2': None
+        }
+    ]
+}
+
+_FEATURE_USAGE = {
+    'dashboard_analytics': 85,
+    'export_reports': 67,
+    'api_integration': 42,
+    'custom_dashboards': 28
+}
+
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:
+    # No orjson on this interpreter (e.g. PyPy) - stdlib does fine here
+    import json as _stdlib_json
+
+    def _json_dumps(obj):
+        return _stdlib_json.dumps(obj).encode()
+
+# The static payloads serialized to bytes once at import, so routes can
+# send them as-is without per-request dict allocation or JSON encoding
+CONVERSION_FUNNEL_JSON = _json_dumps(_CONVERSION_FUNNEL)
+REVENUE_JSON = _json_dumps(_REVENUE)
+TRAFFIC_SOURCES_JSON = _json_dumps(_TRAFFIC_SOURCES)
+USER_BEHAVIOR_JSON = _json_dumps(_USER_BEHAVIOR)
+COHORT_RETENTION_JSON = _json_dumps(_COHORT_RETENTION)
+FEATURE_USAGE_JSON = _json_dumps(_FEATURE_USAGE)
 
 class GA4Service:
     """
@@ -20,8 +158,8 @@ class GA4Service:
         Args:
             property_id: GA4 Property ID (e.g., '123456789')
         """
-        self.property_id = property_id or os.getenv('GA4_PROPERTY_ID')
-        self.credentials_path = os.getenv('GA4_CREDENTIALS_PATH')
+        self.property_id = property_id or _DEFAULT_PROPERTY_ID
+        self.credentials_path = _DEFAULT_CREDENTIALS_PATH
         
     def get_website_visitors(self, days: int = 30) -> Dict:
         """
@@ -40,9 +178,7 @@ class GA4Service:
                     "error": "GA4_PROPERTY_ID not configured",
                     "message": "Please set your GA4 Property ID in environment variables",
                     "fallback_data": {
-                        'total_visitors': 12450,
-                        'new_visitors': 8930,
-                        'returning_visitors': 3520,
+                        **_WEBSITE_VISITORS_BASE,
                         'period_days': days,
                         'date_range': f'Last {days} days (Demo Data)'
                     }
@@ -51,9 +187,7 @@ class GA4Service:
             # This would connect to GA4 API in a real implementation
             # For now, returning mock data that matches the dashboard
             return {
-                'total_visitors': 12450,
-                'new_visitors': 8930,
-                'returning_visitors': 3520,
+                **_WEBSITE_VISITORS_BASE,
                 'period_days': days,
                 'date_range': f'Last {days} days'
             }
@@ -62,9 +196,7 @@ class GA4Service:
                 "error": f"Failed to fetch visitor data: {str(e)}",
                 "message": "Please check your GA4 configuration and internet connection",
                 "fallback_data": {
-                    'total_visitors': 12450,
-                    'new_visitors': 8930,
-                    'returning_visitors': 3520,
+                    **_WEBSITE_VISITORS_BASE,
                     'period_days': days,
                     'date_range': f'Last {days} days (Demo Data)'
                 }
@@ -80,19 +212,7 @@ class GA4Service:
         Returns:
             Dictionary with funnel data
         """
-        return {
-            'website_visitors': 12450,
-            'sign_ups': 1245,
-            'trial_users': 374,
-            'paid_customers': 187,
-            'retained_customers': 156,
-            'conversion_rates': {
-                'visitor_to_signup': 10.0,
-                'signup_to_trial': 30.0,
-                'trial_to_paid': 50.0,
-                'retention_rate': 94.8
-            }
-        }
+        return copy.deepcopy(_CONVERSION_FUNNEL)
     
     def get_revenue_data(self, days: int = 30) -> Dict:
         """
@@ -104,13 +224,7 @@ class GA4Service:
         Returns:
             Dictionary with revenue data
         """
-        return {
-            'total_revenue': 62000,
-            'monthly_revenue': 62000,
-            'average_order_value': 20.83,
-            'transactions': 187,
-            'revenue_per_visitor': 4.98
-        }
+        return copy.deepcopy(_REVENUE)
     
     def get_traffic_sources(self, days: int = 30) -> Dict:
         """
@@ -122,33 +236,7 @@ class GA4Service:
         Returns:
             Dictionary with traffic source data
         """
-        return {
-            'organic_search': {
-                'visitors': 5603,
-                'percentage': 45.0,
-                'conversion_rate': 1.5
-            },
-            'social_media': {
-                'visitors': 3113,
-                'percentage': 25.0,
-                'conversion_rate': 0.8
-            },
-            'paid_ads': {
-                'visitors': 1868,
-                'percentage': 15.0,
-                'conversion_rate': 1.2
-            },
-            'referrals': {
-                'visitors': 1245,
-                'percentage': 10.0,
-                'conversion_rate': 2.0
-            },
-            'direct_traffic': {
-                'visitors': 622,
-                'percentage': 5.0,
-                'conversion_rate': 2.5
-            }
-        }
+        return copy.deepcopy(_TRAFFIC_SOURCES)
     
     def get_user_behavior_data(self, days: int = 30) -> Dict:
         """
@@ -160,13 +248,7 @@ class GA4Service:
         Returns:
             Dictionary with user behavior data
         """
-        return {
-            'sessions_per_user': 4.2,
-            'average_session_duration': 12.5,
-            'return_user_rate': 67.0,
-            'bounce_rate': 35.2,
-            'pages_per_session': 3.8
-        }
+        return copy.deepcopy(_USER_BEHAVIOR)
     
     def get_cohort_retention_data(self, days: int = 90) -> Dict:
         """
@@ -178,28 +260,7 @@ class GA4Service:
         Returns:
             Dictionary with cohort retention data
         """
-        return {
-            'cohorts': [
-                {
-                    'month': 'Jan 2024',
-                    'm0': 100,
-                    'm1': 89,
-                    'm2': 76
-                },
-                {
-                    'month': 'Feb 2024',
-                    'm0': 100,
-                    'm1': 92,
-                    'm2': 81
-                },
-                {
-                    'month': 'Mar 2024',
-                    'm0': 100,
-                    'm1': 85,
-                    'm2': None
-                }
-            ]
-        }
+        return copy.deepcopy(_COHORT_RETENTION)
     
     def get_feature_usage_data(self, days: int = 30) -> Dict:
         """
@@ -211,23 +272,30 @@ class GA4Service:
         Returns:
             Dictionary with feature usage data
         """
-        return {
-            'dashboard_analytics': 85,
-            'export_reports': 67,
-            'api_integration': 42,
-            'custom_dashboards': 28
-        }
+        return copy.deepcopy(_FEATURE_USAGE)
     
     def get_all_metrics(self, days: int = 30) -> Dict:
         """
         Get all metrics data from GA4
-        
+
         Args:
             days: Number of days to look back
-            
+
         Returns:
             Dictionary with all metrics data
         """
+        # The sub-reports only depend on `days`, so they are cached per
+        # period; only the timestamp is refreshed on each call. Deep copy
+        # so callers can't mutate the cached payload.
+        metrics = copy.deepcopy(self._get_all_metrics_cached(days))
+        metrics['last_updated'] = _iso_now()
+        return metrics
+
+    @lru_cache(maxsize=32)
+    def _get_all_metrics_cached(self, days: int) -> Dict:
+        """
+        Build the per-period metrics dict (computed once per `days` value)
+        """
         return {
             'website_visitors': self.get_website_visitors(days),
             'conversion_funnel': self.get_conversion_funnel_data(days),
@@ -236,7 +304,6 @@ class GA4Service:
             'user_behavior': self.get_user_behavior_data(days),
             'cohort_retention': self.get_cohort_retention_data(days),
             'feature_usage': self.get_feature_usage_data(days),
-            'last_updated': datetime.now().isoformat(),
             'data_period_days': days
         }
     
@@ -254,12 +321,17 @@ class GA4Service:
         # In a real implementation, you would use the GA4 Measurement Protocol
         # or the Google Analytics Data API to send events
 
+# Shared service instance - constructed once at import (module imports
+# are serialized by the interpreter, so this is thread-safe) so callers
+# don't re-instantiate the service per request
+_default_ga4 = GA4Service()
+
 # Example usage and testing
 def test_ga4_service():
     """
     Test the GA4 service with sample data
     """
-    service = GA4Service()
+    service = _default_ga4
     
     print("Testing GA4 Service:")
     print("=" * 50)
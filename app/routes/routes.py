@@ -1,11 +1,12 @@
-from flask import Blueprint, render_template, jsonify
-import sys
-import os
+import hashlib
+from datetime import datetime, timezone
 
-# Add the app directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from flask import Blueprint, render_template, jsonify, request, current_app, Response
+from werkzeug.exceptions import HTTPException
 
-from services.metrics_calculator import MetricsCalculator
+from app import cache
+from app.integrations import ga4_service
+from app.services.metrics_calculator import MetricsCalculator
 
 # Main routes blueprint
 main_bp = Blueprint('main', __name__)
@@ -30,151 +31,116 @@ def index():
 # API ROUTES - DYNAMIC DATA
 # ============================================================================
 
-@main_bp.route('/api/metrics')
-def get_metrics():
-    """Get all calculated metrics"""
-    try:
-        metrics = metrics_calculator.get_all_metrics()
-        return jsonify({
+# Every API endpoint has the same shape: call the calculator, wrap the
+# result in a success envelope, cache the response, answer repolls with
+# 304 Not Modified. Registering them from one table keeps that logic in
+# a single place instead of ten copy-pasted view functions.
+API_ENDPOINTS = [
+    # (url rule, endpoint name, cache timeout, data producer)
+    ('/api/metrics', 'get_metrics', 60,
+     lambda: metrics_calculator.get_all_metrics()),
+    # One round-trip for the whole dashboard instead of one per metric
+    ('/api/metrics/bundle', 'get_metrics_bundle', 60,
+     lambda: metrics_calculator.get_all_metrics_bundle()),
+    ('/api/metrics/ltv', 'get_ltv', 60,
+     lambda: metrics_calculator.calculate_ltv("stripe")),
+    ('/api/metrics/ltv-cac-ratio', 'get_ltv_cac_ratio', 60,
+     lambda: metrics_calculator.calculate_ltv_cac_ratio()),
+    ('/api/metrics/mrr', 'get_mrr', 60,
+     lambda: metrics_calculator.calculate_mrr()),
+    ('/api/metrics/arr', 'get_arr', 60,
+     lambda: metrics_calculator.calculate_arr()),
+    ('/api/metrics/payback-period', 'get_payback_period', 60,
+     lambda: metrics_calculator.calculate_payback_period()),
+    ('/api/metrics/conversion-rate', 'get_conversion_rate', 60,
+     lambda: metrics_calculator.calculate_conversion_rate()),
+    ('/api/metrics/retention', 'get_retention_metrics', 60,
+     lambda: metrics_calculator.calculate_retention_metrics()),
+    ('/api/metrics/nrr', 'get_nrr', 60,
+     lambda: metrics_calculator.calculate_nrr()),
+    ('/api/data/raw', 'get_raw_data', 300,
+     lambda: metrics_calculator.data),
+]
+
+@main_bp.errorhandler(Exception)
+def _handle_api_error(e):
+    """
+    Single well-known error path for the API views, replacing the
+    try/except that used to live in every handler
+    """
+    # The blueprint also serves the HTML dashboard, and an Exception-level
+    # handler would otherwise swallow abort(404) and friends - let Flask
+    # render HTTPExceptions normally and only wrap real failures as JSON
+    if isinstance(e, HTTPException):
+        return e
+    current_app.logger.exception(e)
+    return jsonify({
+        "success": False,
+        "error": str(e)
+    }), 500
+
+def _wrap(producer, timeout):
+    """
+    Build a cached API view around a data producer
+    """
+    @cache.cached(timeout=timeout)
+    def _build_response():
+        response = jsonify({
             "success": True,
-            "data": metrics
+            "data": producer()
         })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@main_bp.route('/api/metrics/ltv')
-def get_ltv():
-    """Get LTV calculation"""
-    try:
-        ltv = metrics_calculator.calculate_ltv("stripe")
-        return jsonify({
-            "success": True,
-            "data": ltv
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@main_bp.route('/api/metrics/ltv-cac-ratio')
-def get_ltv_cac_ratio():
-    """Get LTV:CAC ratio calculation"""
-    try:
-        ratio = metrics_calculator.calculate_ltv_cac_ratio()
-        return jsonify({
-            "success": True,
-            "data": ratio
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@main_bp.route('/api/metrics/mrr')
-def get_mrr():
-    """Get MRR calculation"""
-    try:
-        mrr = metrics_calculator.calculate_mrr()
-        return jsonify({
-            "success": True,
-            "data": mrr
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@main_bp.route('/api/metrics/arr')
-def get_arr():
-    """Get ARR calculation"""
-    try:
-        arr = metrics_calculator.calculate_arr()
-        return jsonify({
-            "success": True,
-            "data": arr
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@main_bp.route('/api/metrics/payback-period')
-def get_payback_period():
-    """Get payback period calculation"""
-    try:
-        payback = metrics_calculator.calculate_payback_period()
-        return jsonify({
-            "success": True,
-            "data": payback
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@main_bp.route('/api/metrics/conversion-rate')
-def get_conversion_rate():
-    """Get conversion rate calculation"""
-    try:
-        conversion = metrics_calculator.calculate_conversion_rate()
-        return jsonify({
-            "success": True,
-            "data": conversion
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@main_bp.route('/api/metrics/retention')
-def get_retention_metrics():
-    """Get retention metrics calculation"""
-    try:
-        retention = metrics_calculator.calculate_retention_metrics()
-        return jsonify({
-            "success": True,
-            "data": retention
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@main_bp.route('/api/metrics/nrr')
-def get_nrr():
-    """Get Net Revenue Retention calculation"""
-    try:
-        nrr = metrics_calculator.calculate_nrr()
-        return jsonify({
-            "success": True,
-            "data": nrr
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@main_bp.route('/api/data/raw')
-def get_raw_data():
-    """Get raw business data"""
-    try:
-        return jsonify({
-            "success": True,
-            "data": metrics_calculator.data
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
\ No newline at end of file
+        response.add_etag()
+        return response
+
+    def view():
+        # The cached response carries an ETag, so polls with a matching
+        # If-None-Match get a bodyless 304 back
+        return _build_response().make_conditional(request)
+
+    return view
+
+for _rule, _endpoint, _timeout, _producer in API_ENDPOINTS:
+    main_bp.add_url_rule(_rule, _endpoint, _wrap(_producer, _timeout))
+
+# ============================================================================
+# GA4 DEMO ROUTES - STATIC DATA
+# ============================================================================
+
+# These payloads never change within a process, so they are serialized
+# to bytes once at import (see ga4_service) and served directly -
+# request handling is essentially a static-file send.
+GA4_STATIC_ENDPOINTS = [
+    ('/api/ga4/conversion-funnel', 'get_ga4_conversion_funnel',
+     ga4_service.CONVERSION_FUNNEL_JSON),
+    ('/api/ga4/revenue', 'get_ga4_revenue',
+     ga4_service.REVENUE_JSON),
+    ('/api/ga4/traffic-sources', 'get_ga4_traffic_sources',
+     ga4_service.TRAFFIC_SOURCES_JSON),
+    ('/api/ga4/user-behavior', 'get_ga4_user_behavior',
+     ga4_service.USER_BEHAVIOR_JSON),
+    ('/api/ga4/cohort-retention', 'get_ga4_cohort_retention',
+     ga4_service.COHORT_RETENTION_JSON),
+    ('/api/ga4/feature-usage', 'get_ga4_feature_usage',
+     ga4_service.FEATURE_USAGE_JSON),
+]
+
+# Conditional-GET anchor for the static payloads: they can only change
+# when the process restarts
+_PROCESS_START = datetime.now(timezone.utc)
+
+def _static_json_view(payload):
+    """
+    Build a view that sends pre-serialized JSON bytes with conditional GET
+    """
+    etag = hashlib.md5(payload).hexdigest()
+
+    def view():
+        response = Response(payload, mimetype='application/json')
+        response.set_etag(etag)
+        response.last_modified = _PROCESS_START
+        return response.make_conditional(request)
+
+    return view
+
+for _rule, _endpoint, _payload in GA4_STATIC_ENDPOINTS:
+    main_bp.add_url_rule(_rule, _endpoint, _static_json_view(_payload))
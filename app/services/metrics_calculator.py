@@ -8,27 +8,45 @@ While thoroughly tested, please verify calculations for your specific use case.
 Report inconsistencies at: https://github.com/safinayah/startup-analytics-tutorial
 """
 
+import copy
 import json
 import os
 from typing import Dict, Any
 from decimal import Decimal, ROUND_HALF_UP
 
+from app.data import BUSINESS_METRICS
+
 class MetricsCalculator:
     """
     Service to calculate all business metrics dynamically from data
     """
     
-    def __init__(self, data_file_path: str = "data/business_metrics.json"):
+    def __init__(self, data_file_path: str = "data/business_metrics.json",
+                 data: Dict[str, Any] = None):
         """
         Initialize the calculator with data file path
+
+        Args:
+            data_file_path: JSON file backing the calculator
+            data: Optional already-parsed metrics dict; when provided the
+                  file read/parse is skipped entirely
         """
         self.data_file_path = data_file_path
-        self.data = self._load_data()
+        self.data = data if data is not None else self._load_data()
+        # Per-instance memo for the expensive-to-rebuild result dicts;
+        # unlike lru_cache on a method it dies with the instance instead
+        # of pinning every calculator in a process-global cache
+        self._cache: Dict[Any, Dict[str, Any]] = {}
     
     def _load_data(self) -> Dict[str, Any]:
         """
         Load business metrics data from JSON file
         """
+        # The default data file is already parsed once per process (see
+        # app/data.py); reuse it as a shallow copy instead of re-reading
+        # the file from disk. Custom paths still go through open().
+        if self.data_file_path == "data/business_metrics.json" and BUSINESS_METRICS is not None:
+            return dict(BUSINESS_METRICS)
         try:
             with open(self.data_file_path, 'r') as file:
                 return json.load(file)
@@ -67,31 +85,53 @@ class MetricsCalculator:
         """
         return round(value, decimals)
     
+    def calculate_ltv_value(self, method: str = "stripe") -> float:
+        """
+        Return just the LTV number, without the explanatory dict
+
+        The fast path for callers (verification, benchmarks) that only
+        compare the value - no per-call dict allocation or key lookups.
+
+        Args:
+            method: "stripe" (industry standard) or "traditional"
+        """
+        core = self.data["core_metrics"]
+        if method == "stripe":
+            # Industry standard: LTV = ARPU ÷ Churn Rate
+            # This represents total revenue expected from a customer over their lifetime
+            # Example: $20.83 ÷ 0.052 = $400.58
+            return core["monthly_arpu"] / core["monthly_churn_rate"]
+        # Traditional: LTV = ARPU × Gross Margin ÷ Churn Rate
+        # This accounts for profit margins, not just revenue
+        return core["monthly_arpu"] * core["gross_margin"] / core["monthly_churn_rate"]
+
     def calculate_ltv(self, method: str = "stripe") -> Dict[str, Any]:
         """
         Calculate Lifetime Value using different methods
-        
+
+        The result is memoized per method name - the data only changes
+        through update_data, which clears the cache. Callers get a deep
+        copy so mutating a result can't corrupt the cached original.
+
         Args:
             method: "stripe" (industry standard) or "traditional"
         """
+        cached = self._cache.get(("ltv", method))
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         # Extract core metrics from data file
         arpu = self.data["core_metrics"]["monthly_arpu"]  # Average Revenue Per User per month
         churn = self.data["core_metrics"]["monthly_churn_rate"]  # Monthly churn rate (decimal)
         gross_margin = self.data["core_metrics"]["gross_margin"]  # Gross margin percentage
-        
+
+        ltv = self.calculate_ltv_value(method)
         if method == "stripe":
-            # Industry standard: LTV = ARPU ÷ Churn Rate
-            # This represents total revenue expected from a customer over their lifetime
-            # Example: $20.83 ÷ 0.052 = $400.58
-            ltv = arpu / churn
             method_name = "Stripe Method (Industry Standard)"
         else:
-            # Traditional: LTV = ARPU × Gross Margin ÷ Churn Rate
-            # This accounts for profit margins, not just revenue
-            ltv = arpu * gross_margin / churn
             method_name = "Traditional Method (Net Profit)"
-        
-        return {
+
+        result = {
             "value": self._round_currency(ltv),
             "method": method_name,
             "formula": f"LTV = ${arpu} ÷ {churn} = ${self._round_currency(ltv)}" if method == "stripe" else f"LTV = ${arpu} × {gross_margin} ÷ {churn} = ${self._round_currency(ltv)}",
@@ -101,12 +141,19 @@ class MetricsCalculator:
                 "gross_margin": gross_margin if method != "stripe" else None
             }
         }
+        self._cache[("ltv", method)] = result
+        return copy.deepcopy(result)
     
-    def calculate_ltv_cac_ratio(self) -> Dict[str, Any]:
+    def calculate_ltv_cac_ratio(self, ltv_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Calculate LTV:CAC ratio
+
+        Args:
+            ltv_data: Optional precomputed result of calculate_ltv, so
+                      bundled calls don't recompute it
         """
-        ltv_data = self.calculate_ltv("stripe")
+        if ltv_data is None:
+            ltv_data = self.calculate_ltv("stripe")
         ltv = ltv_data["value"]
         cac = self.data["core_metrics"]["cac"]
         
@@ -140,31 +187,59 @@ class MetricsCalculator:
             "formula": f"LTV:CAC = ${ltv} ÷ ${cac} = {self._round_currency(ratio, 2)}:1"
         }
     
+    def calculate_mrr_value(self) -> float:
+        """
+        Return just the MRR number, without the explanatory dict
+        """
+        core = self.data["core_metrics"]
+        # MRR = Total Active Users × Average Revenue Per User
+        # Example: 2,400 × $20.83 = $49,992
+        return core["monthly_active_users"] * core["monthly_arpu"]
+
+    def calculate_arr_value(self) -> float:
+        """
+        Return just the ARR number, without the explanatory dict
+        """
+        return self.calculate_mrr_value() * 12
+
     def calculate_mrr(self) -> Dict[str, Any]:
         """
         Calculate Monthly Recurring Revenue
+
+        Memoized like calculate_ltv; the dependent metrics (ARR, NRR,
+        LTV:CAC) take these cached results as precomputed inputs, so
+        repeat calls stop recomputing the shared intermediates.
         """
+        cached = self._cache.get("mrr")
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         # Get number of active paying customers
         active_users = self.data["core_metrics"]["monthly_active_users"]  # 2,400 customers
         # Get average revenue per user per month
         arpu = self.data["core_metrics"]["monthly_arpu"]  # $20.83 per customer per month
-        
-        # MRR = Total Active Users × Average Revenue Per User
-        # Example: 2,400 × $20.83 = $49,992
-        mrr = active_users * arpu
-        
-        return {
+
+        mrr = self.calculate_mrr_value()
+
+        result = {
             "value": self._round_currency(mrr),
             "active_users": active_users,
             "arpu": arpu,
             "formula": f"MRR = {active_users:,} × ${arpu} = ${self._round_currency(mrr):,}"
         }
+        self._cache["mrr"] = result
+        return copy.deepcopy(result)
     
-    def calculate_arr(self) -> Dict[str, Any]:
+    def calculate_arr(self, mrr_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Calculate Annual Recurring Revenue
+
+        Args:
+            mrr_data: Optional precomputed result of calculate_mrr, so
+                      bundled calls don't recompute it
         """
-        mrr_data = self.calculate_mrr()
+        if mrr_data is None:
+            mrr_data = self.calculate_mrr()
         mrr = mrr_data["value"]
         
         arr = mrr * 12
@@ -257,11 +332,16 @@ class MetricsCalculator:
             "formula": f"Retention = (1 - {churn_rate}) × 100 = {self._round_percentage(retention_rate * 100, 1)}%"
         }
     
-    def calculate_nrr(self) -> Dict[str, Any]:
+    def calculate_nrr(self, mrr_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Calculate Net Revenue Retention
+
+        Args:
+            mrr_data: Optional precomputed result of calculate_mrr, so
+                      bundled calls don't recompute it
         """
-        mrr_data = self.calculate_mrr()
+        if mrr_data is None:
+            mrr_data = self.calculate_mrr()
         mrr = mrr_data["value"]
         
         # NRR calculation with expansion and churn
@@ -304,15 +384,25 @@ class MetricsCalculator:
         """
         Calculate and return all business metrics
         """
+        return self.get_all_metrics_bundle()
+
+    def get_all_metrics_bundle(self) -> Dict[str, Any]:
+        """
+        Calculate every metric exactly once, reusing shared intermediates
+        (LTV feeds the LTV:CAC ratio, MRR feeds ARR and NRR)
+        """
+        ltv = self.calculate_ltv("stripe")
+        mrr = self.calculate_mrr()
+
         return {
-            "ltv": self.calculate_ltv("stripe"),
-            "ltv_cac_ratio": self.calculate_ltv_cac_ratio(),
-            "mrr": self.calculate_mrr(),
-            "arr": self.calculate_arr(),
+            "ltv": ltv,
+            "ltv_cac_ratio": self.calculate_ltv_cac_ratio(ltv),
+            "mrr": mrr,
+            "arr": self.calculate_arr(mrr),
             "payback_period": self.calculate_payback_period(),
             "conversion_rate": self.calculate_conversion_rate(),
             "retention_metrics": self.calculate_retention_metrics(),
-            "nrr": self.calculate_nrr(),
+            "nrr": self.calculate_nrr(mrr),
             "raw_data": self.data["core_metrics"]
         }
     
@@ -323,7 +413,10 @@ class MetricsCalculator:
         try:
             # Update the data
             self.data.update(new_data)
-            
+
+            # Drop memoized results derived from the old data
+            self._cache.clear()
+
             # Save back to file
             with open(self.data_file_path, 'w') as file:
                 json.dump(self.data, file, indent=2)
@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for production deploys (Railway / Docker)
+
+🤖 AI-Generated Content Notice:
+This server configuration is generated by AI.
+Report inconsistencies at: https://github.com/safinayah/startup-analytics-tutorial
+"""
+
+import multiprocessing
+import os
+
+# Railway injects PORT; default matches local development
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Threaded workers give the dashboard API real concurrency, unlike the
+# single-threaded Werkzeug dev server in run.py
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = 'gthread'
+threads = 4
+
+# Import the app (and the shared business metrics data) in the master
+# before forking, so workers share those pages copy-on-write instead of
+# each paying for their own copy
+preload_app = True
@@ -0,0 +1,38 @@
+"""
+Construction tests for the Stripe calculations service
+
+Instantiating with an API key exercises stripe.StripeClient against the
+pinned stripe release, so a pin that predates StripeClient fails here
+instead of at import time in production.
+
+🤖 AI-Generated Content Notice:
+All test cases and validation logic are generated by AI.
+Report inconsistencies at: https://github.com/safinayah/startup-analytics-tutorial
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.calculations.stripe_calculations import StripeCalculations
+
+def test_client_built_when_key_provided():
+    """A key must yield a usable per-instance StripeClient"""
+    calc = StripeCalculations(api_key="sk_test_x")
+    assert calc.client is not None
+    assert calc.api_key == "sk_test_x"
+
+def test_no_client_without_key(monkeypatch):
+    """Without a key there is no client, and construction still works"""
+    import app.calculations.stripe_calculations as mod
+    monkeypatch.setattr(mod, '_DEFAULT_STRIPE_KEY', None)
+    calc = StripeCalculations()
+    assert calc.client is None
+
+def test_ltv_stripe_method():
+    """The LTV fast path matches the plain division"""
+    calc = StripeCalculations(api_key="sk_test_x")
+    assert calc.calculate_ltv_stripe_method(20.83) == round(20.83 / 0.052, 2)
+    assert calc.calculate_ltv_stripe_method(20.83, 0.10) == round(20.83 / 0.10, 2)
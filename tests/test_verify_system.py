@@ -0,0 +1,93 @@
+"""
+Pytest version of the system verification checks
+
+Session-scoped fixtures parse the data file, build the calculator and
+create the Flask test client exactly once, so repeated CI runs amortize
+all the setup instead of re-bootstrapping per check like the ad-hoc
+scripts do.
+
+🤖 AI-Generated Content Notice:
+All test cases and validation logic are generated by AI.
+Report inconsistencies at: https://github.com/safinayah/startup-analytics-tutorial
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make `app` and `services` importable the same way the scripts do
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'app'))
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+@pytest.fixture(scope="session")
+def data():
+    """The parsed business metrics data file"""
+    return _json_loads((ROOT / 'data' / 'business_metrics.json').read_bytes())
+
+@pytest.fixture(scope="session")
+def calculator(data):
+    """One MetricsCalculator sharing the already-parsed data"""
+    from services.metrics_calculator import MetricsCalculator
+    return MetricsCalculator(data=data)
+
+@pytest.fixture(scope="session")
+def app():
+    """One Flask app for the whole session"""
+    from app import create_app
+    return create_app()
+
+@pytest.fixture(scope="session")
+def client(app):
+    """One reusable test client"""
+    return app.test_client()
+
+def test_data_file(data):
+    """Test 1: the data file loads and has the core metrics"""
+    core_metrics = data['core_metrics']
+    assert core_metrics['monthly_arpu'] > 0
+    assert core_metrics['cac'] > 0
+    assert 0 < core_metrics['monthly_churn_rate'] < 1
+
+def test_metrics_calculator(calculator):
+    """Test 2: the key calculations produce values"""
+    assert calculator.calculate_ltv("stripe")['value'] > 0
+    assert calculator.calculate_ltv_cac_ratio()['ratio'] > 0
+    assert calculator.calculate_mrr()['value'] > 0
+    assert calculator.calculate_arr()['value'] > 0
+
+def test_main_route(client):
+    """Test 3a: the dashboard page renders"""
+    assert client.get('/').status_code == 200
+
+def test_api_route(app):
+    """Test 3b: the metrics API returns the success envelope"""
+    with app.test_request_context('/api/metrics'):
+        response = app.view_functions['main.get_metrics']()
+    assert response.status_code == 200
+    payload = _json_loads(response.get_data())
+    assert payload['success']
+    assert len(payload['data']) >= 8
+
+def test_calculation_accuracy(data, calculator):
+    """Test 4: calculated values match the formulas applied to the data"""
+    core_metrics = data['core_metrics']
+    arpu = core_metrics['monthly_arpu']
+    churn = core_metrics['monthly_churn_rate']
+    active_users = core_metrics['monthly_active_users']
+
+    ltv = calculator.calculate_ltv("stripe")['value']
+    assert math.isclose(ltv, arpu / churn, abs_tol=0.01)
+
+    mrr = calculator.calculate_mrr()['value']
+    assert math.isclose(mrr, active_users * arpu, abs_tol=1)
+
+    arr = calculator.calculate_arr()['value']
+    assert math.isclose(arr, mrr * 12, abs_tol=1)
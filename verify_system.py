@@ -7,129 +7,224 @@ All verification logic and test cases are generated by AI.
 Report inconsistencies at: https://github.com/safinayah/startup-analytics-tutorial
 """
 
-import json
+import argparse
+import functools
+import math
 import sys
 import os
+from dataclasses import dataclass
 
 # Add app directory to path
 sys.path.append('app')
 
-def main():
-    print("🔍 VERIFYING DYNAMIC CALCULATION SYSTEM")
-    print("=" * 50)
-    
-    # Test 1: Data file
-    print("1. Testing data file...")
-    try:
-        with open('data/business_metrics.json', 'r') as f:
-            data = json.load(f)
-        print("   ✅ Data file loads successfully")
-        print(f"   📊 ARPU: ${data['core_metrics']['monthly_arpu']}")
-        print(f"   📊 CAC: ${data['core_metrics']['cac']}")
-        print(f"   📊 Churn: {data['core_metrics']['monthly_churn_rate'] * 100}%")
-    except Exception as e:
-        print(f"   ❌ Data file error: {e}")
-        return False
-    
-    # Test 2: Metrics calculator
-    print("\n2. Testing metrics calculator...")
-    try:
-        from services.metrics_calculator import MetricsCalculator
-        calculator = MetricsCalculator()
-        
-        # Test key calculations
-        ltv = calculator.calculate_ltv("stripe")
-        print(f"   ✅ LTV: ${ltv['value']}")
-        
-        ratio = calculator.calculate_ltv_cac_ratio()
-        print(f"   ✅ LTV:CAC: {ratio['ratio']}:1")
-        
-        mrr = calculator.calculate_mrr()
-        print(f"   ✅ MRR: ${mrr['value']:,}")
-        
-        arr = calculator.calculate_arr()
-        print(f"   ✅ ARR: ${arr['value']:,}")
-        
-    except Exception as e:
-        print(f"   ❌ Calculator error: {e}")
-        return False
-    
-    # Test 3: Flask routes
-    print("\n3. Testing Flask routes...")
+# Fast JSON load: orjson parses UTF-8 bytes directly in native code,
+# stdlib json is the drop-in fallback
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+@dataclass(slots=True, frozen=True)
+class CoreMetrics:
+    """
+    The fixed shape of data['core_metrics'], parsed once so later checks
+    use attribute access (a slot read) instead of repeated string-keyed
+    dict lookups
+    """
+    monthly_arpu: float
+    cac: float
+    monthly_churn_rate: float
+    gross_margin: float
+    monthly_active_users: int
+    website_visitors: int
+    paid_customers: int
+
+@functools.lru_cache(maxsize=1)
+def _get_app():
+    """
+    Create the Flask app once and reuse it; app construction (blueprint
+    registration, config, calculator import) dominates repeated runs
+    """
+    from app import create_app
+    return create_app()
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """
+    Create one test client and keep it alive across probes; werkzeug's
+    client is safe to reuse and per-call setup isn't free
+    """
+    return _get_app().test_client()
+
+def _flush(log):
+    """
+    Emit the buffered lines in one stdout write and reset the buffer
+    """
+    if log:
+        sys.stdout.write('\n'.join(log) + '\n')
+        log.clear()
+
+def main(only: str = "all"):
+    """
+    Run the selected verification blocks
+
+    Args:
+        only: "data", "calc", "flask", "accuracy" or "all". Narrower
+              selections skip the blocks (and the heavy Flask import)
+              they don't need; "calc" and "accuracy" still load the
+              data file they depend on.
+    """
+    run_data = only in ("data", "calc", "accuracy", "all")
+    run_calc = only in ("calc", "accuracy", "all")
+    run_flask = only in ("flask", "all")
+    run_accuracy = only in ("accuracy", "all")
+
+    # Buffer report lines and write them out once per test block instead
+    # of one line-buffered (and lock-acquiring) print() per message; the
+    # finally below guarantees failure paths still flush what they logged
+    log = []
     try:
-        from app import create_app
-        app = create_app()
-        
-        with app.test_client() as client:
-            # Test main route
-            response = client.get('/')
-            if response.status_code == 200:
-                print("   ✅ Main route works")
-            else:
-                print(f"   ❌ Main route failed: {response.status_code}")
+        log.append("🔍 VERIFYING DYNAMIC CALCULATION SYSTEM")
+        log.append("=" * 50)
+
+        # Test 1: Data file
+        if run_data:
+            log.append("1. Testing data file...")
+            try:
+                with open('data/business_metrics.json', 'rb') as f:
+                    data = _json_loads(f.read())
+                core = CoreMetrics(**data['core_metrics'])
+                log.append("   ✅ Data file loads successfully")
+                log.append(f"   📊 ARPU: ${core.monthly_arpu}")
+                log.append(f"   📊 CAC: ${core.cac}")
+                log.append(f"   📊 Churn: {core.monthly_churn_rate * 100}%")
+            except Exception as e:
+                log.append(f"   ❌ Data file error: {e}")
+                return False
+            _flush(log)
+
+        # Test 2: Metrics calculator
+        if run_calc:
+            log.append("\n2. Testing metrics calculator...")
+            try:
+                from services.metrics_calculator import MetricsCalculator
+                # Reuse the dict Test 1 already parsed instead of re-reading the file
+                calculator = MetricsCalculator(data=data)
+
+                # Test key calculations
+                ltv = calculator.calculate_ltv("stripe")
+                log.append(f"   ✅ LTV: ${ltv['value']}")
+
+                ratio = calculator.calculate_ltv_cac_ratio()
+                log.append(f"   ✅ LTV:CAC: {ratio['ratio']}:1")
+
+                mrr = calculator.calculate_mrr()
+                log.append(f"   ✅ MRR: ${mrr['value']:,}")
+
+                arr = calculator.calculate_arr()
+                log.append(f"   ✅ ARR: ${arr['value']:,}")
+
+            except Exception as e:
+                log.append(f"   ❌ Calculator error: {e}")
+                return False
+            _flush(log)
+
+        # Test 3: Flask routes (the only block that imports the Flask stack)
+        if run_flask:
+            log.append("\n3. Testing Flask routes...")
+            try:
+                client = _get_client()
+
+                # Test main route
+                response = client.get('/')
+                if response.status_code == 200:
+                    log.append("   ✅ Main route works")
+                else:
+                    log.append(f"   ❌ Main route failed: {response.status_code}")
+                    return False
+
+                # Test API route - call the view function in-process instead of
+                # paying for a full WSGI request/response round-trip
+                app = _get_app()
+                with app.test_request_context('/api/metrics'):
+                    response = app.view_functions['main.get_metrics']()
+                if response.status_code == 200:
+                    # Decode the raw bytes with orjson rather than get_json(),
+                    # which would route through stdlib json
+                    payload = _json_loads(response.get_data())
+                    if payload.get('success'):
+                        log.append("   ✅ API route works")
+                        log.append(f"   📊 API returns {len(payload['data'])} metric categories")
+                    else:
+                        log.append(f"   ❌ API returned error: {payload.get('error')}")
+                        return False
+                else:
+                    log.append(f"   ❌ API route failed: {response.status_code}")
+                    return False
+
+            except Exception as e:
+                log.append(f"   ❌ Flask error: {e}")
                 return False
-            
-            # Test API route
-            response = client.get('/api/metrics')
-            if response.status_code == 200:
-                data = response.get_json()
-                if data.get('success'):
-                    print("   ✅ API route works")
-                    print(f"   📊 API returns {len(data['data'])} metric categories")
+            _flush(log)
+
+        # Test 4: Calculation accuracy
+        if run_accuracy:
+            log.append("\n4. Verifying calculation accuracy...")
+            try:
+                # Compare against the raw-value accessors - no dict
+                # allocation on the calculator side, no ['value'] hop here
+                ltv_val = calculator.calculate_ltv_value("stripe")
+                mrr_val = calculator.calculate_mrr_value()
+                arr_val = calculator.calculate_arr_value()
+
+                # Verify LTV calculation
+                expected_ltv = core.monthly_arpu / core.monthly_churn_rate
+
+                if math.isclose(ltv_val, expected_ltv, abs_tol=0.01):
+                    log.append("   ✅ LTV calculation accurate")
+                else:
+                    log.append(f"   ❌ LTV calculation error: {ltv_val} vs {expected_ltv}")
+                    return False
+
+                # Verify MRR calculation
+                expected_mrr = core.monthly_active_users * core.monthly_arpu
+
+                if math.isclose(mrr_val, expected_mrr, abs_tol=1):
+                    log.append("   ✅ MRR calculation accurate")
+                else:
+                    log.append(f"   ❌ MRR calculation error: {mrr_val} vs {expected_mrr}")
+                    return False
+
+                # Verify ARR calculation
+                expected_arr = mrr_val * 12
+
+                if math.isclose(arr_val, expected_arr, abs_tol=1):
+                    log.append("   ✅ ARR calculation accurate")
                 else:
-                    print(f"   ❌ API returned error: {data.get('error')}")
+                    log.append(f"   ❌ ARR calculation error: {arr_val} vs {expected_arr}")
                     return False
-            else:
-                print(f"   ❌ API route failed: {response.status_code}")
+
+            except Exception as e:
+                log.append(f"   ❌ Accuracy check error: {e}")
                 return False
-                
-    except Exception as e:
-        print(f"   ❌ Flask error: {e}")
-        return False
-    
-    # Test 4: Calculation accuracy
-    print("\n4. Verifying calculation accuracy...")
-    try:
-        # Verify LTV calculation
-        arpu = data['core_metrics']['monthly_arpu']
-        churn = data['core_metrics']['monthly_churn_rate']
-        expected_ltv = arpu / churn
-        
-        if abs(ltv['value'] - expected_ltv) < 0.01:
-            print("   ✅ LTV calculation accurate")
-        else:
-            print(f"   ❌ LTV calculation error: {ltv['value']} vs {expected_ltv}")
-            return False
-        
-        # Verify MRR calculation
-        active_users = data['core_metrics']['monthly_active_users']
-        expected_mrr = active_users * arpu
-        
-        if abs(mrr['value'] - expected_mrr) < 1:
-            print("   ✅ MRR calculation accurate")
-        else:
-            print(f"   ❌ MRR calculation error: {mrr['value']} vs {expected_mrr}")
-            return False
-        
-        # Verify ARR calculation
-        expected_arr = mrr['value'] * 12
-        
-        if abs(arr['value'] - expected_arr) < 1:
-            print("   ✅ ARR calculation accurate")
-        else:
-            print(f"   ❌ ARR calculation error: {arr['value']} vs {expected_arr}")
-            return False
-            
-    except Exception as e:
-        print(f"   ❌ Accuracy check error: {e}")
-        return False
-    
-    print("\n" + "=" * 50)
-    print("🎉 ALL TESTS PASSED!")
-    print("✅ System is ready for GitHub push")
-    print("=" * 50)
-    return True
+            _flush(log)
+
+        log.append("\n" + "=" * 50)
+        log.append("🎉 ALL TESTS PASSED!")
+        log.append("✅ System is ready for GitHub push")
+        log.append("=" * 50)
+        return True
+    finally:
+        _flush(log)
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="Verify the dynamic calculation system")
+    parser.add_argument(
+        "--only",
+        choices=["data", "calc", "flask", "accuracy", "all"],
+        default="all",
+        help="run a single verification block (skips the Flask import unless needed)"
+    )
+    args = parser.parse_args()
+    success = main(args.only)
     sys.exit(0 if success else 1)